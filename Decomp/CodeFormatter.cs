@@ -9,8 +9,9 @@ namespace Hoho.Decomp {
 	public static class CodeFormatter {
 		/// <summary>
 		/// Format directory using external CLI tools - MAXIMUM SPEED.
+		/// Returns true only when every formatter ran and exited successfully.
 		/// </summary>
-		public static async Task FormatExtractedCodeAsync(string extractedDir, string formattedDir) {
+		public static async Task<bool> FormatExtractedCodeAsync(string extractedDir, string formattedDir) {
 			using IDisposable timer = Logger.TimeOperation("Format Extracted Code Directory");
 
 			Directory.CreateDirectory(formattedDir);
@@ -19,19 +20,20 @@ namespace Hoho.Decomp {
 			await CopyDirectoryAsync(extractedDir, formattedDir);
 
 			// Run formatters on copied files
-			Task[] tasks = new[] {
+			Task<bool>[] tasks = new[] {
 				FormatWithPrettierAsync(formattedDir), // JS/TS/JSON
 				FormatWithDotnetAsync(formattedDir)    // C#
 			};
 
-			await Task.WhenAll(tasks);
+			bool[] results = await Task.WhenAll(tasks);
 			Logger.Info("Code formatting completed using external CLI tools");
+			return results.All(ok => ok);
 		}
 
 		/// <summary>
 		/// Format JS/TS/JSON using Prettier CLI.
 		/// </summary>
-		private static async Task FormatWithPrettierAsync(string dir) {
+		private static async Task<bool> FormatWithPrettierAsync(string dir) {
 			try {
 				ProcessStartInfo process = new ProcessStartInfo {
 					FileName               = "npx",
@@ -44,22 +46,32 @@ namespace Hoho.Decomp {
 
 				using Process? proc = Process.Start(process);
 				if (proc != null) {
-					await proc.WaitForExitAsync();
+					await ProcessPipes.DrainAndWaitAsync(proc);
 					Logger.Debug("Prettier formatting completed with exit code {ExitCode}", proc.ExitCode);
+					return proc.ExitCode == 0;
 				}
 			} catch (Exception ex) {
 				Logger.Warn("Prettier not available: {Error}", ex.Message);
 			}
+
+			return false;
 		}
 
 		/// <summary>
 		/// Format C# using dotnet format CLI.
+		/// Not applicable (and reported as successful) when the directory holds no C# files.
 		/// </summary>
-		private static async Task FormatWithDotnetAsync(string dir) {
+		private static async Task<bool> FormatWithDotnetAsync(string dir) {
+			if (!Directory.EnumerateFiles(dir, "*.cs", SearchOption.AllDirectories).Any()) {
+				Logger.Debug("No C# files in {Directory}, skipping dotnet format", dir);
+				return true;
+			}
+
 			try {
+				// --folder formats loose files; extracted packages carry no .csproj or .sln
 				ProcessStartInfo process = new ProcessStartInfo {
 					FileName               = "dotnet",
-					Arguments              = "format --include \"**/*.cs\"",
+					Arguments              = "format --folder --include \"**/*.cs\"",
 					WorkingDirectory       = dir,
 					RedirectStandardOutput = true,
 					RedirectStandardError  = true,
@@ -68,12 +80,15 @@ namespace Hoho.Decomp {
 
 				using Process? proc = Process.Start(process);
 				if (proc != null) {
-					await proc.WaitForExitAsync();
+					await ProcessPipes.DrainAndWaitAsync(proc);
 					Logger.Debug("dotnet format completed with exit code {ExitCode}", proc.ExitCode);
+					return proc.ExitCode == 0;
 				}
 			} catch (Exception ex) {
 				Logger.Warn("dotnet format not available: {Error}", ex.Message);
 			}
+
+			return false;
 		}
 
 		/// <summary>
@@ -82,14 +97,15 @@ namespace Hoho.Decomp {
 		private static async Task CopyDirectoryAsync(string sourceDir, string destDir) {
 			Directory.CreateDirectory(destDir);
 
-			string[] files = Directory.GetFiles(sourceDir, "*", SearchOption.AllDirectories);
-			IEnumerable<Task> tasks = files.Select(file =>
+			// Mirror the directory tree once up front rather than re-creating the parent for every file
+			foreach (string dir in Directory.EnumerateDirectories(sourceDir, "*", SearchOption.AllDirectories)) {
+				Directory.CreateDirectory(Path.Combine(destDir, Path.GetRelativePath(sourceDir, dir)));
+			}
+
+			IEnumerable<Task> tasks = Directory.EnumerateFiles(sourceDir, "*", SearchOption.AllDirectories).Select(file =>
 				Task.Run(() => {
 					string relativePath = Path.GetRelativePath(sourceDir, file);
-					string destFile     = Path.Combine(destDir, relativePath);
-
-					Directory.CreateDirectory(Path.GetDirectoryName(destFile)!);
-					File.Copy(file, destFile, true);
+					File.Copy(file, Path.Combine(destDir, relativePath), true);
 				}));
 
 			await Task.WhenAll(tasks);
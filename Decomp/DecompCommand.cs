@@ -20,6 +20,7 @@ namespace Hoho.Decomp {
 
 			// Analysis commands
 			AddCommand(new ConsistencyCommand());
+			AddCommand(new SetupAgentsCommand());
 
 			// Mapping management
 			AddCommand(new AddMappingCommand());
@@ -75,6 +76,21 @@ namespace Hoho.Decomp {
 			}
 		}
 
+		/// <summary>
+		/// Download and analyze the reference CLI agent packages
+		/// </summary>
+		private class SetupAgentsCommand : Command {
+			public SetupAgentsCommand() : base("setup-agents", "Download and analyze reference CLI agent packages") {
+				Option<bool> forceOpt = new Option<bool>("--force", () => false, "Redo download, extraction and formatting even when up to date");
+
+				AddOption(forceOpt);
+
+				this.SetHandler(async force => {
+					await DecompilerService.SetupAsync(force);
+				}, forceOpt);
+			}
+		}
+
 		/// <summary>
 		/// Learn from directory of manual edits
 		/// </summary>
@@ -484,9 +500,8 @@ namespace Hoho.Decomp {
 
 			private static async Task<string> GetLatestVersionAsync() {
 				// Check npm registry for latest version
-				using HttpClient http     = new HttpClient();
-				string           response = await http.GetStringAsync("https://registry.npmjs.org/@anthropic-ai/claude-code/latest");
-				JsonDocument     data     = JsonDocument.Parse(response);
+				string       response = await DecompilerService.GetStringAsync("https://registry.npmjs.org/@anthropic-ai/claude-code/latest");
+				JsonDocument data     = JsonDocument.Parse(response);
 				return data.RootElement.GetProperty("version").GetString() ?? "unknown";
 			}
 
@@ -500,12 +515,10 @@ namespace Hoho.Decomp {
 
 				Directory.CreateDirectory(Path.GetDirectoryName(outputPath)!);
 
-				using HttpClient http = new HttpClient();
-				string           url  = $"https://registry.npmjs.org/@anthropic-ai/claude-code/-/claude-code-{version}.tgz";
+				string url = $"https://registry.npmjs.org/@anthropic-ai/claude-code/-/claude-code-{version}.tgz";
 
 				Logger.Info($"Downloading from {url}");
-				byte[] bytes = await http.GetByteArrayAsync(url);
-				await File.WriteAllBytesAsync(outputPath, bytes);
+				await DecompilerService.DownloadFileAsync(url, outputPath);
 
 				return outputPath;
 			}
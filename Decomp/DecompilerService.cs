@@ -1,4 +1,5 @@
 using System.IO.Compression;
+using System.Net;
 using System.Text.Json;
 using Hoho.Core;
 
@@ -12,6 +13,8 @@ namespace Hoho.Decomp {
 			Timeout = TimeSpan.FromMinutes(5)
 		};
 
+		private static readonly string[] _requiredDirectories = { "decomp", "decomp/claude-code", ".cache", ".tmp" };
+
 		private static readonly JsonSerializerOptions _jsonOptions = new JsonSerializerOptions {
 			PropertyNamingPolicy        = JsonNamingPolicy.SnakeCaseLower,
 			PropertyNameCaseInsensitive = true
@@ -19,8 +22,9 @@ namespace Hoho.Decomp {
 
 		/// <summary>
 		/// INSTANT decomp setup - analyze all CLI agents.
+		/// Steps already completed for the current package version are reused unless <paramref name="force"/> is set.
 		/// </summary>
-		public static async Task SetupAsync() {
+		public static async Task SetupAsync(bool force = false) {
 			using IDisposable timer = Logger.TimeOperation("Decomp Setup");
 
 			Console.WriteLine("🔥 HOHO DECOMP SETUP - Reference CLI Agent Analysis");
@@ -34,7 +38,7 @@ namespace Hoho.Decomp {
 			string[] agents = new[] { "claude-code" }; // Start with Claude Code
 			Logger.Info("Analyzing {AgentCount} CLI agents", agents.Length);
 
-			IEnumerable<Task> tasks = agents.Select(AnalyzeAgentAsync);
+			IEnumerable<Task> tasks = agents.Select(agent => AnalyzeAgentAsync(agent, force));
 			await Task.WhenAll(tasks);
 
 			// Generate concatenation scripts
@@ -80,7 +84,7 @@ namespace Hoho.Decomp {
 		/// <summary>
 		/// Analyze a specific CLI agent with ZERO-ALLOCATION performance.
 		/// </summary>
-		public static async Task AnalyzeAgentAsync(string agentName) {
+		public static async Task AnalyzeAgentAsync(string agentName, bool force = false) {
 			Console.WriteLine($"\nProcessing {agentName}...");
 
 			string agentDir = Path.Combine("decomp", agentName);
@@ -89,7 +93,7 @@ namespace Hoho.Decomp {
 			try {
 				switch (agentName.ToLowerInvariant()) {
 					case "claude-code":
-						await AnalyzeClaudeCodeAsync(agentDir);
+						await AnalyzeClaudeCodeAsync(agentDir, force);
 						break;
 
 					default:
@@ -104,13 +108,11 @@ namespace Hoho.Decomp {
 		/// <summary>
 		/// Analyze Claude Code npm package with native C# performance.
 		/// </summary>
-		private static async Task AnalyzeClaudeCodeAsync(string outputDir) {
+		private static async Task AnalyzeClaudeCodeAsync(string outputDir, bool force) {
 			const string npmRegistry = "https://registry.npmjs.org/@anthropic-ai/claude-code";
 
 			// Fetch package info with AOT-compatible JSON
-			HttpResponseMessage response = await _httpClient.GetAsync(npmRegistry);
-			response.EnsureSuccessStatusCode();
-			string          jsonString  = await response.Content.ReadAsStringAsync();
+			string          jsonString  = await GetCachedJsonAsync(npmRegistry, "claude-code-registry");
 			NpmPackageInfo? packageInfo = JsonSerializer.Deserialize(jsonString, JsonContext.Default.NpmPackageInfo);
 			if (packageInfo?.DistTags?.Latest == null) {
 				Console.WriteLine("Could not fetch Claude Code package info");
@@ -124,33 +126,108 @@ namespace Hoho.Decomp {
 			string tarballUrl  = $"https://registry.npmjs.org/@anthropic-ai/claude-code/-/claude-code-{version}.tgz";
 			string tarballPath = Path.Combine(outputDir, $"claude-code-{version}.tgz");
 
-			await DownloadFileAsync(tarballUrl, tarballPath);
-			Console.WriteLine($"✓ Downloaded {Path.GetFileName(tarballPath)}");
+			// Published tarballs are immutable, so an existing file for this version is reusable
+			if (force || !File.Exists(tarballPath)) {
+				await DownloadFileAsync(tarballUrl, tarballPath);
+				Console.WriteLine($"✓ Downloaded {Path.GetFileName(tarballPath)}");
+			} else {
+				Console.WriteLine($"✓ Using cached {Path.GetFileName(tarballPath)}");
+			}
 
-			// Extract with native .NET
-			string extractDir = Path.Combine(outputDir, "extracted");
-			await ExtractTarGzAsync(tarballPath, extractDir);
-			Console.WriteLine($"✓ Extracted to {extractDir}");
+			// Extract with native .NET. Stamps are cleared before a step runs and written only
+			// once it succeeds, so a failed or interrupted run is never treated as current.
+			string extractDir   = Path.Combine(outputDir, "extracted");
+			string extractStamp = Path.Combine(outputDir, "extracted.stamp");
+			if (force || !IsStampCurrent(extractStamp, extractDir, version)) {
+				File.Delete(extractStamp);
+				await ExtractTarGzAsync(tarballPath, extractDir);
+				await File.WriteAllTextAsync(extractStamp, version);
+				Console.WriteLine($"✓ Extracted to {extractDir}");
+			} else {
+				Console.WriteLine($"✓ {extractDir} is up to date");
+			}
 
 			// Analyze package
 			await AnalyzeExtractedPackageAsync(extractDir, outputDir);
 
 			// Format extracted code
 			string formattedDir = Path.Combine(outputDir, "formatted");
-			await CodeFormatter.FormatExtractedCodeAsync(extractDir, formattedDir);
-			Console.WriteLine($"✓ Formatted code saved to {formattedDir}");
+			string formatStamp  = Path.Combine(outputDir, "formatted.stamp");
+			if (force || !IsStampCurrent(formatStamp, formattedDir, version)) {
+				File.Delete(formatStamp);
+				if (await CodeFormatter.FormatExtractedCodeAsync(extractDir, formattedDir)) {
+					await File.WriteAllTextAsync(formatStamp, version);
+					Console.WriteLine($"✓ Formatted code saved to {formattedDir}");
+				} else {
+					Console.WriteLine($"✗ Formatting incomplete in {formattedDir}, will retry on next setup");
+				}
+			} else {
+				Console.WriteLine($"✓ {formattedDir} is up to date");
+			}
 		}
 
 		/// <summary>
-		/// Download file with HttpClient performance optimizations.
+		/// True when a step's output directory still exists and its stamp file records the given package version.
 		/// </summary>
-		private static async Task DownloadFileAsync(string url, string outputPath) {
-			using HttpResponseMessage response = await _httpClient.GetAsync(url, HttpCompletionOption.ResponseHeadersRead);
+		private static bool IsStampCurrent(string stampPath, string stepDir, string version) {
+			return Directory.Exists(stepDir) && File.Exists(stampPath) && File.ReadAllText(stampPath) == version;
+		}
+
+		/// <summary>
+		/// Fetch a JSON document through a conditional GET, caching the body and ETag under .cache/.
+		/// A 304 Not Modified response is served from the cached copy without re-transferring the body.
+		/// </summary>
+		private static async Task<string> GetCachedJsonAsync(string url, string cacheName) {
+			string cachePath = Path.Combine(".cache", $"{cacheName}.json");
+			string etagPath  = Path.Combine(".cache", $"{cacheName}.etag");
+
+			using HttpRequestMessage request = new HttpRequestMessage(HttpMethod.Get, url);
+			if (File.Exists(cachePath) && File.Exists(etagPath)) {
+				request.Headers.TryAddWithoutValidation("If-None-Match", await File.ReadAllTextAsync(etagPath));
+			}
+
+			using HttpResponseMessage response = await _httpClient.SendAsync(request);
+			if (response.StatusCode == HttpStatusCode.NotModified) {
+				Logger.Debug("Using cached {CacheName} (not modified)", cacheName);
+				return await File.ReadAllTextAsync(cachePath);
+			}
+
 			response.EnsureSuccessStatusCode();
+			string json = await response.Content.ReadAsStringAsync();
+
+			// Drop the old ETag before replacing the body so the pair can never mismatch
+			Directory.CreateDirectory(".cache");
+			File.Delete(etagPath);
+			await File.WriteAllTextAsync(cachePath, json);
+			if (response.Headers.ETag != null) {
+				await File.WriteAllTextAsync(etagPath, response.Headers.ETag.ToString());
+			}
+
+			return json;
+		}
+
+		/// <summary>
+		/// GET a URL as a string through the shared client, so every registry request reuses one connection pool.
+		/// </summary>
+		internal static Task<string> GetStringAsync(string url) => _httpClient.GetStringAsync(url);
+
+		/// <summary>
+		/// Download file with HttpClient performance optimizations.
+		/// Streams to a .part file and renames on completion, so an interrupted
+		/// download is never mistaken for a cached one.
+		/// </summary>
+		internal static async Task DownloadFileAsync(string url, string outputPath) {
+			string partialPath = outputPath + ".part";
+
+			using (HttpResponseMessage response = await _httpClient.GetAsync(url, HttpCompletionOption.ResponseHeadersRead)) {
+				response.EnsureSuccessStatusCode();
+
+				await using Stream     contentStream = await response.Content.ReadAsStreamAsync();
+				await using FileStream fileStream    = File.Create(partialPath);
+				await contentStream.CopyToAsync(fileStream);
+			}
 
-			await using Stream     contentStream = await response.Content.ReadAsStreamAsync();
-			await using FileStream fileStream    = File.Create(outputPath);
-			await contentStream.CopyToAsync(fileStream);
+			File.Move(partialPath, outputPath, true);
 		}
 
 		/// <summary>
@@ -189,8 +266,7 @@ namespace Hoho.Decomp {
 			await writer.WriteLineAsync();
 
 			if (Directory.Exists(extractDir)) {
-				string[] files = Directory.GetFiles(extractDir, "*", SearchOption.AllDirectories);
-				foreach (string file in files) {
+				foreach (string file in Directory.EnumerateFiles(extractDir, "*", SearchOption.AllDirectories)) {
 					string relativePath = Path.GetRelativePath(extractDir, file);
 					await writer.WriteLineAsync(relativePath);
 				}
@@ -203,8 +279,7 @@ namespace Hoho.Decomp {
 		/// Ensure all required directories exist.
 		/// </summary>
 		private static void EnsureDirectories() {
-			string[] dirs = new[] { "decomp", "decomp/claude-code", ".cache", ".tmp" };
-			foreach (string dir in dirs) {
+			foreach (string dir in _requiredDirectories) {
 				Directory.CreateDirectory(dir);
 			}
 		}
@@ -0,0 +1,29 @@
+using System.Diagnostics;
+
+namespace Hoho.Decomp {
+	/// <summary>
+	/// Helpers for waiting on external tools whose output is redirected.
+	/// Every redirected pipe must be read, or the child stalls once the pipe buffer fills.
+	/// </summary>
+	internal static class ProcessPipes {
+		/// <summary>
+		/// Discard stdout and stderr as raw bytes while waiting for exit, for callers that don't need the text.
+		/// </summary>
+		public static Task DrainAndWaitAsync(Process proc) {
+			return Task.WhenAll(
+				proc.StandardOutput.BaseStream.CopyToAsync(Stream.Null),
+				proc.StandardError.BaseStream.CopyToAsync(Stream.Null),
+				proc.WaitForExitAsync());
+		}
+
+		/// <summary>
+		/// Read stdout as text while discarding stderr, then wait for exit.
+		/// </summary>
+		public static async Task<string> ReadOutputAndWaitAsync(Process proc) {
+			Task   drainError = proc.StandardError.BaseStream.CopyToAsync(Stream.Null);
+			string output     = await proc.StandardOutput.ReadToEndAsync();
+			await Task.WhenAll(drainError, proc.WaitForExitAsync());
+			return output;
+		}
+	}
+}
@@ -1,4 +1,5 @@
 using System.CommandLine;
+using System.Text;
 using System.Text.Json;
 using System.Text.RegularExpressions;
 using Hoho.Core;
@@ -450,7 +451,7 @@ namespace Hoho.Decomp {
 							versions.Add(info);
 						}
 						info.HasDev       = true;
-						info.DevFileCount = Directory.GetFiles(dir, "*.js").Length;
+						info.DevFileCount = Directory.EnumerateFiles(dir, "*.js").Count();
 					} else if (name.EndsWith("-final")) {
 						string       version = name.Replace("-final", "");
 						VersionInfo? info    = versions.FirstOrDefault(v => v.Version == version);
@@ -466,12 +467,14 @@ namespace Hoho.Decomp {
 							versions.Add(info);
 						}
 						info.HasOriginal       = true;
-						info.OriginalFileCount = Directory.GetFiles(dir, "*.js").Length;
+						info.OriginalFileCount = Directory.EnumerateFiles(dir, "*.js").Count();
 					}
 				}
 
-				Console.WriteLine("\nExtracted Versions:");
-				Console.WriteLine("─".PadRight(60, '─'));
+				// Buffer the whole listing and emit it with a single console write
+				StringBuilder output = new StringBuilder();
+				output.AppendLine("\nExtracted Versions:");
+				output.AppendLine("─".PadRight(60, '─'));
 
 				foreach (VersionInfo v in versions.OrderByDescending(v => v.Version)) {
 					List<string> status = new List<string>();
@@ -479,16 +482,18 @@ namespace Hoho.Decomp {
 					if (v.HasDev) status.Add($"dev ({v.DevFileCount} files)");
 					if (v.HasFinal) status.Add("final");
 
-					Console.WriteLine($"{v.Version,-15} {string.Join(", ", status)}");
+					output.AppendLine($"{v.Version,-15} {string.Join(", ", status)}");
 				}
 
 				// Show current mappings count
 				if (File.Exists("decomp/mappings.json")) {
 					string                      json     = File.ReadAllText("decomp/mappings.json");
 					Dictionary<string, string>? mappings = JsonSerializer.Deserialize<Dictionary<string, string>>(json);
-					Console.WriteLine();
-					Console.WriteLine($"Symbol mappings: {mappings?.Count ?? 0}");
+					output.AppendLine();
+					output.AppendLine($"Symbol mappings: {mappings?.Count ?? 0}");
 				}
+
+				Console.Write(output.ToString());
 			});
 		}
 
@@ -10,6 +10,43 @@ namespace Hoho.Decomp {
 	/// Creates a navigable symbol map without the bulk.
 	/// </summary>
 	public static class TreeSitterIndexer {
+		// Caps concurrently indexed files so large packages don't spawn a tree-sitter process per file at once
+		private static readonly SemaphoreSlim _indexSlots = new SemaphoreSlim(Environment.ProcessorCount);
+
+		// Compiled once and shared by every indexed file instead of being rebuilt per call.
+		private static readonly (Regex Regex, string Type)[] _declarationPatterns = new[] {
+			(@"export\s+(?:type|interface)\s+(\w+)", "Type"),
+			(@"export\s+class\s+(\w+)", "Class"),
+			(@"export\s+(?:async\s+)?function\s+(\w+)", "Function"),
+			(@"export\s+const\s+(\w+)", "Constant"),
+			(@"export\s+(?:let|var)\s+(\w+)", "Variable"),
+			(@"(?:type|interface)\s+(\w+)\s*[={]", "Type"),
+			(@"class\s+(\w+)\s*[{]", "Class"),
+			(@"(?:async\s+)?function\s+(\w+)\s*\(", "Function"),
+			(@"const\s+(\w+)\s*=\s*(?:async\s*)?\(", "Arrow Function")
+		}.Select(p => (new Regex(p.Item1, RegexOptions.Compiled), p.Item2)).ToArray();
+
+		private static readonly Regex[] _minifiedPatterns = new[] {
+			@"exports\.(\w+)",           // CommonJS exports
+			@"export\s*{\s*([^}]+)\s*}", // ES6 exports
+			@"\.prototype\.(\w+)",       // Prototype methods
+			@"window\.(\w+)",            // Global assignments
+			@"global\.(\w+)",            // Node globals
+			@"define\([""'](\w+)[""']",  // AMD modules
+			@"function\s+(\w{3,})\s*\(", // Named functions (3+ chars)
+			@"class\s+(\w+)",            // Class definitions
+			@"const\s+(\w{3,})\s*=",     // Const assignments (3+ chars)
+			@"let\s+(\w{3,})\s*=",       // Let assignments (3+ chars)
+			@"var\s+(\w{3,})\s*="        // Var assignments (3+ chars)
+		}.Select(p => new Regex(p, RegexOptions.Compiled)).ToArray();
+
+		// One pass over each tree-sitter output line instead of four substring scans
+		private static readonly Regex _treeSitterDeclaration = new Regex(@"(function|class|interface|type_alias)_declaration", RegexOptions.Compiled);
+		private static readonly Regex _treeSitterName        = new Regex(@"name:\s*(\w+)", RegexOptions.Compiled);
+
+		// Probed once per process instead of spawning `tree-sitter --version` for every indexed file
+		private static readonly Lazy<Task<bool>> _treeSitterAvailable = new(ProbeTreeSitterAsync);
+
 		/// <summary>
 		/// Generate a tree-sitter index of the codebase.
 		/// </summary>
@@ -31,21 +68,36 @@ namespace Hoho.Decomp {
 
 			// Process TypeScript definitions first (most valuable)
 			string[] dtsFiles = Directory.GetFiles(packageDir, "*.d.ts");
-			foreach (string file in dtsFiles) {
-				await IndexTypeScriptFileAsync(file, indexBuilder);
-			}
 
 			// Process JavaScript modules
 			IEnumerable<string> jsFiles = Directory.GetFiles(packageDir, "*.mjs")
 				.Concat(Directory.GetFiles(packageDir, "*.js"));
 
-			foreach (string file in jsFiles) {
-				await IndexJavaScriptFileAsync(file, indexBuilder);
+			// Each file spawns its own tree-sitter processes, so index them concurrently
+			// into per-file buffers and append the results in the original order.
+			IEnumerable<Task<StringBuilder>> tasks = dtsFiles.Select(file => IndexToBufferAsync(file, IndexTypeScriptFileAsync))
+				.Concat(jsFiles.Select(file => IndexToBufferAsync(file, IndexJavaScriptFileAsync)));
+
+			foreach (StringBuilder fileIndex in await Task.WhenAll(tasks)) {
+				indexBuilder.Append(fileIndex);
 			}
 
 			return indexBuilder.ToString();
 		}
 
+		private static async Task<StringBuilder> IndexToBufferAsync(string filePath, Func<string, StringBuilder, Task> indexFile) {
+			StringBuilder output = new StringBuilder();
+
+			await _indexSlots.WaitAsync();
+			try {
+				await indexFile(filePath, output);
+			} finally {
+				_indexSlots.Release();
+			}
+
+			return output;
+		}
+
 		/// <summary>
 		/// Index a TypeScript definition file using tree-sitter.
 		/// </summary>
@@ -213,21 +265,7 @@ namespace Hoho.Decomp {
 
 			try {
 				// Check if tree-sitter is available
-				Process treeSitterCheck = new Process {
-					StartInfo = new ProcessStartInfo {
-						FileName               = "tree-sitter",
-						Arguments              = "--version",
-						RedirectStandardOutput = true,
-						RedirectStandardError  = true,
-						UseShellExecute        = false,
-						CreateNoWindow         = true
-					}
-				};
-
-				treeSitterCheck.Start();
-				await treeSitterCheck.WaitForExitAsync();
-
-				if (treeSitterCheck.ExitCode != 0) {
+				if (!await _treeSitterAvailable.Value) {
 					// Fallback to regex-based extraction
 					return await ExtractSymbolsWithRegexAsync(filePath);
 				}
@@ -245,8 +283,7 @@ namespace Hoho.Decomp {
 				};
 
 				process.Start();
-				string output = await process.StandardOutput.ReadToEndAsync();
-				await process.WaitForExitAsync();
+				string output = await ProcessPipes.ReadOutputAndWaitAsync(process);
 
 				// Parse tree-sitter output to extract symbols
 				symbols = ParseTreeSitterOutput(output);
@@ -259,6 +296,31 @@ namespace Hoho.Decomp {
 			return symbols;
 		}
 
+		/// <summary>
+		/// Probe for the tree-sitter CLI by running <c>tree-sitter --version</c>.
+		/// </summary>
+		private static async Task<bool> ProbeTreeSitterAsync() {
+			try {
+				using Process treeSitterCheck = new Process {
+					StartInfo = new ProcessStartInfo {
+						FileName               = "tree-sitter",
+						Arguments              = "--version",
+						RedirectStandardOutput = true,
+						RedirectStandardError  = true,
+						UseShellExecute        = false,
+						CreateNoWindow         = true
+					}
+				};
+
+				treeSitterCheck.Start();
+				await ProcessPipes.DrainAndWaitAsync(treeSitterCheck);
+				return treeSitterCheck.ExitCode == 0;
+			} catch (Exception ex) {
+				Logger.Debug($"Tree-sitter not available, using fallback: {ex.Message}");
+				return false;
+			}
+		}
+
 		/// <summary>
 		/// Fallback regex-based symbol extraction.
 		/// </summary>
@@ -266,23 +328,9 @@ namespace Hoho.Decomp {
 			List<SymbolInfo> symbols = new List<SymbolInfo>();
 			string           content = await File.ReadAllTextAsync(filePath);
 
-			// TypeScript/JavaScript patterns
-			(string, string)[] patterns = new[] {
-				(@"export\s+(?:type|interface)\s+(\w+)", "Type"),
-				(@"export\s+class\s+(\w+)", "Class"),
-				(@"export\s+(?:async\s+)?function\s+(\w+)", "Function"),
-				(@"export\s+const\s+(\w+)", "Constant"),
-				(@"export\s+(?:let|var)\s+(\w+)", "Variable"),
-				(@"(?:type|interface)\s+(\w+)\s*[={]", "Type"),
-				(@"class\s+(\w+)\s*[{]", "Class"),
-				(@"(?:async\s+)?function\s+(\w+)\s*\(", "Function"),
-				(@"const\s+(\w+)\s*=\s*(?:async\s*)?\(", "Arrow Function")
-			};
-
 			string[] lines = content.Split('\n');
 
-			foreach ((string pattern, string type) in patterns) {
-				Regex regex = new Regex(pattern);
+			foreach ((Regex regex, string type) in _declarationPatterns) {
 				for (int i = 0; i < lines.Length; i++) {
 					MatchCollection matches = regex.Matches(lines[i]);
 					foreach (Match match in matches) {
@@ -313,23 +361,7 @@ namespace Hoho.Decomp {
 			HashSet<string> symbols = new HashSet<string>();
 			string          content = await File.ReadAllTextAsync(filePath);
 
-			// Look for common patterns in minified code - expanded patterns
-			string[] patterns = new[] {
-				@"exports\.(\w+)",           // CommonJS exports
-				@"export\s*{\s*([^}]+)\s*}", // ES6 exports
-				@"\.prototype\.(\w+)",       // Prototype methods
-				@"window\.(\w+)",            // Global assignments
-				@"global\.(\w+)",            // Node globals
-				@"define\([""'](\w+)[""']",  // AMD modules
-				@"function\s+(\w{3,})\s*\(", // Named functions (3+ chars)
-				@"class\s+(\w+)",            // Class definitions
-				@"const\s+(\w{3,})\s*=",     // Const assignments (3+ chars)
-				@"let\s+(\w{3,})\s*=",       // Let assignments (3+ chars)
-				@"var\s+(\w{3,})\s*="        // Var assignments (3+ chars)
-			};
-
-			foreach (string pattern in patterns) {
-				Regex           regex   = new Regex(pattern);
+			foreach (Regex regex in _minifiedPatterns) {
 				MatchCollection matches = regex.Matches(content);
 
 				foreach (Match match in matches) {
@@ -358,16 +390,17 @@ namespace Hoho.Decomp {
 			string[] lines = output.Split('\n');
 			foreach (string line in lines) {
 				// Look for function, class, interface declarations
-				if (line.Contains("function_declaration") ||
-				    line.Contains("class_declaration") ||
-				    line.Contains("interface_declaration") ||
-				    line.Contains("type_alias_declaration")) {
+				Match declaration = _treeSitterDeclaration.Match(line);
+				if (declaration.Success) {
 					// Extract symbol name from the line
-					Match match = Regex.Match(line, @"name:\s*(\w+)");
+					Match match = _treeSitterName.Match(line);
 					if (match.Success) {
-						string type = line.Contains("function") ? "Function" :
-							line.Contains("class")              ? "Class" :
-							line.Contains("interface")          ? "Interface" : "Type";
+						string type = declaration.Groups[1].Value switch {
+							"function"  => "Function",
+							"class"     => "Class",
+							"interface" => "Interface",
+							_           => "Type"
+						};
 
 						symbols.Add(new SymbolInfo {
 							Name = match.Groups[1].Value,
@@ -72,7 +72,7 @@ namespace Hoho.Decomp {
 			}
 
 			// Extract and organize
-			if (sourcePath.EndsWith(".tgz") || sourcePath.EndsWith(".tar.gz")) {
+			if (sourcePath.EndsWith(".tgz", StringComparison.Ordinal) || sourcePath.EndsWith(".tar.gz", StringComparison.Ordinal)) {
 				await ExtractTarballAsync(sourcePath, originalDir);
 			} else if (File.Exists(sourcePath)) {
 				// Single file (like cli.js)
@@ -458,12 +458,10 @@ The tool will learn from your edits and apply them to future versions.
 
 			Directory.CreateDirectory(Path.GetDirectoryName(cachePath)!);
 
-			using HttpClient http = new HttpClient();
-			string           url  = $"https://registry.npmjs.org/@anthropic-ai/claude-code/-/claude-code-{version}.tgz";
+			string url = $"https://registry.npmjs.org/@anthropic-ai/claude-code/-/claude-code-{version}.tgz";
 
 			Logger.Info($"Downloading {url}...");
-			byte[] bytes = await http.GetByteArrayAsync(url);
-			await File.WriteAllBytesAsync(cachePath, bytes);
+			await DecompilerService.DownloadFileAsync(url, cachePath);
 
 			return cachePath;
 		}
@@ -524,21 +522,24 @@ The tool will learn from your edits and apply them to future versions.
 		/// List all managed versions
 		/// </summary>
 		public void ListVersions() {
-			Console.WriteLine("\nManaged Claude Code Versions:");
-			Console.WriteLine("=".PadRight(60, '='));
+			StringBuilder sb = new StringBuilder();
+			sb.AppendLine("\nManaged Claude Code Versions:");
+			sb.AppendLine("=".PadRight(60, '='));
 
 			foreach (KeyValuePair<string, VersionInfo> version in _versions.OrderByDescending(v => v.Value.DateAdded)) {
 				VersionInfo info = version.Value;
-				Console.WriteLine($"\n{info.Version}:");
-				Console.WriteLine($"  Status: {info.Status}");
-				Console.WriteLine($"  Added: {info.DateAdded:yyyy-MM-dd}");
+				sb.AppendLine($"\n{info.Version}:");
+				sb.AppendLine($"  Status: {info.Status}");
+				sb.AppendLine($"  Added: {info.DateAdded:yyyy-MM-dd}");
 
 				if (info.MappingsCount > 0) {
-					Console.WriteLine($"  Mappings: {info.MappingsCount}");
+					sb.AppendLine($"  Mappings: {info.MappingsCount}");
 				}
 
-				Console.WriteLine($"  Path: {info.Path}");
+				sb.AppendLine($"  Path: {info.Path}");
 			}
+
+			Console.Write(sb.ToString());
 		}
 	}
 
@@ -18,6 +18,16 @@ namespace Hoho;
 /// </summary>
 public static partial class Program {
     public static async Task<int> Main(string[] args) {
+		// Print-only commands skip logger and command-tree setup entirely
+		switch (args) {
+			case ["version"]:
+				ShowVersion();
+				return 0;
+			case ["home"]:
+				ShowHome();
+				return 0;
+		}
+
 		// Initialize logging
 		Log.Logger = new LoggerConfiguration()
 			.MinimumLevel.Information()
@@ -380,22 +390,30 @@ public static partial class Program {
         };
     }
 
+	private static readonly Lazy<byte[]> _saitamaFace = new(() => ReadEmbedded("art_2.txt"));
+
 	private static void ShowHome() {
-		Console.WriteLine(ReadEmbedded("art_2.txt"));
+		// The art is plain ASCII: hand the resource bytes straight to stdout instead of
+		// decoding to a string and letting the console writer re-encode it.
+		Stream stdout = Console.OpenStandardOutput();
+		stdout.Write(_saitamaFace.Value);
+		stdout.Flush();
+		Console.WriteLine();
 		Console.WriteLine();
 		Console.WriteLine("HOHO - The CLI Agent That Just Says 'OK.'");
 		Console.WriteLine("Shadow Protocol Active");
 	}
 
-    private static string ReadEmbedded(string name)
+    private static byte[] ReadEmbedded(string name)
     {
         var asm = typeof(Program).Assembly;
         var resource = asm.GetManifestResourceNames().FirstOrDefault(n => n.EndsWith(name, StringComparison.OrdinalIgnoreCase));
-        if (resource is null) return "";
+        if (resource is null) return Array.Empty<byte>();
         using var s = asm.GetManifestResourceStream(resource);
-        if (s is null) return "";
-        using var r = new StreamReader(s);
-        return r.ReadToEnd();
+        if (s is null) return Array.Empty<byte>();
+        var bytes = new byte[s.Length];
+        s.ReadExactly(bytes);
+        return bytes;
     }
 
     private static void ShowVersion() {